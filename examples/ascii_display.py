@@ -16,56 +16,141 @@ Controls:
 """
 
 import mlx90640
+import queue
+import threading
 import time
 import sys
+import numpy as np
 
 
 # Configuration
-TEMP_MIN = 15.0  # Minimum temperature for colormap (°C)
-TEMP_MAX = 35.0  # Maximum temperature for colormap (°C)
-SCALE = 1        # Horizontal scaling (1-4, larger = wider display)
-BLOCK = "██"     # Unicode block character for pixels
+TEMP_MIN = 15.0   # Minimum temperature for colormap (°C)
+TEMP_MAX = 35.0   # Maximum temperature for colormap (°C)
+SCALE = 1         # Horizontal scaling (1-4, larger = wider display)
+BLOCK = "██"      # Unicode block character for pixels
+HEADER_EVERY = 4  # Refresh header stats every N frames
+
+
+# Inferno colormap control points, evenly spaced over [0.0-1.0]
+_COLORS = np.array([
+    (0.001462, 0.000466, 0.013866),  # 0.0   - dark purple/black
+    (0.087411, 0.044556, 0.224813),  # 0.125 - deep purple
+    (0.258234, 0.038571, 0.406485),  # 0.25  - purple
+    (0.416331, 0.090203, 0.432943),  # 0.375 - purple-red
+    (0.645581, 0.133503, 0.392508),  # 0.5   - red
+    (0.798216, 0.280197, 0.469538),  # 0.625 - orange-red
+    (0.924870, 0.517763, 0.295662),  # 0.75  - orange
+    (0.987622, 0.809330, 0.145357),  # 0.875 - yellow-orange
+    (0.988362, 0.998364, 0.644924),  # 1.0   - bright yellow
+])
+_POSITIONS = np.linspace(0.0, 1.0, len(_COLORS))
+
+
+def inferno_colormap(values):
+    """
+    Convert normalized values [0.0-1.0] to RGB using Inferno colormap
 
+    Args:
+        values: Array of normalized values between 0.0 (coldest) and 1.0 (hottest)
 
-def inferno_colormap(value):
+    Returns:
+        uint8 array of shape values.shape + (3,) with (r, g, b) in range [0-255]
     """
-    Convert normalized value [0.0-1.0] to RGB using Inferno colormap
+    # Linear interpolation between control points, one C call per channel.
+    # np.interp clamps values outside [0, 1] to the end colors.
+    rgb = np.stack([np.interp(values, _POSITIONS, _COLORS[:, c]) for c in range(3)], axis=-1)
+
+    # Convert to [0-255] range
+    return (rgb * 255).astype(np.uint8)
+
+
+# Precomputed 256-entry colormap, indexed by quantized temperature
+LUT = inferno_colormap(np.linspace(0.0, 1.0, 256))
+
+# Linear quantization of temperature to LUT index: q = (t - _Q_MIN) * _Q_SCALE
+_Q_MIN = np.float32(TEMP_MIN)
+_Q_SCALE = np.float32(255.0 / (TEMP_MAX - TEMP_MIN))
+
+# Pixel character(s) emitted for each pixel, scaled horizontally
+BLOCK_BYTES = (BLOCK * SCALE).encode()
+
+# Precomposed pixel output for each LUT entry, one row of bytes per entry:
+# ESC[38;2;R;G;Bm sets foreground color, followed by the pixel character(s).
+# RGB components are zero-padded so every pixel has the same byte length.
+ANSI = np.array([
+    np.frombuffer(f"\x1b[38;2;{r:03d};{g:03d};{b:03d}m".encode() + BLOCK_BYTES, np.uint8)
+    for r, g, b in LUT.tolist()
+])
+PIXEL_BYTES = ANSI.shape[1]
+
+# Appended to each image row: ESC[0m resets the color before the newline
+ROW_END = b"\x1b[0m\n"
+
+# Moves the cursor back to the top of the display (24 image lines + header)
+CURSOR_UP = b"\x1b[25A"
+
+
+def quantize(frame):
+    """
+    Quantize temperatures to colormap indices [0-255] over TEMP_MIN..TEMP_MAX
 
     Args:
-        value: Normalized value between 0.0 (coldest) and 1.0 (hottest)
+        frame: Array of temperatures in °C
 
     Returns:
-        Tuple of (r, g, b) integers in range [0-255]
+        uint8 array of the same shape, suitable for indexing LUT
     """
-    # Clamp value to [0, 1]
-    value = max(0.0, min(1.0, value))
-
-    # Inferno colormap control points
-    colors = [
-        (0.001462, 0.000466, 0.013866),  # 0.0   - dark purple/black
-        (0.087411, 0.044556, 0.224813),  # 0.125 - deep purple
-        (0.258234, 0.038571, 0.406485),  # 0.25  - purple
-        (0.416331, 0.090203, 0.432943),  # 0.375 - purple-red
-        (0.645581, 0.133503, 0.392508),  # 0.5   - red
-        (0.798216, 0.280197, 0.469538),  # 0.625 - orange-red
-        (0.924870, 0.517763, 0.295662),  # 0.75  - orange
-        (0.987622, 0.809330, 0.145357),  # 0.875 - yellow-orange
-        (0.988362, 0.998364, 0.644924)   # 1.0   - bright yellow
-    ]
-
-    # Interpolate between control points
-    scaled = value * (len(colors) - 1)
-    idx1 = int(scaled)
-    idx2 = min(idx1 + 1, len(colors) - 1)
-    frac = scaled - idx1
-
-    # Linear interpolation
-    r = colors[idx1][0] + (colors[idx2][0] - colors[idx1][0]) * frac
-    g = colors[idx1][1] + (colors[idx2][1] - colors[idx1][1]) * frac
-    b = colors[idx1][2] + (colors[idx2][2] - colors[idx1][2]) * frac
+    # Offset, scale and clamp in one float32 buffer, then narrow to uint8 once.
+    # Non-finite readings map to the hottest (NaN, +inf) or coldest (-inf) color.
+    scaled = np.subtract(frame, _Q_MIN, dtype=np.float32)
+    scaled *= _Q_SCALE
+    np.nan_to_num(scaled, copy=False, nan=255, posinf=255, neginf=0)
+    np.clip(scaled, 0, 255, out=scaled)
+    return scaled.astype(np.uint8)
 
-    # Convert to [0-255] range
-    return (int(r * 255), int(g * 255), int(b * 255))
+
+def make_frame_buffer():
+    """
+    Allocate the reusable output buffer for render()
+
+    Returns:
+        uint8 array holding 24 rows of colored pixels, each terminated by ROW_END
+    """
+    buf = np.empty((24, 32 * PIXEL_BYTES + len(ROW_END)), dtype=np.uint8)
+    buf[:, 32 * PIXEL_BYTES:] = np.frombuffer(ROW_END, np.uint8)
+    return buf
+
+
+def render(frame2d, out):
+    """
+    Render a 24x32 temperature frame into out as ANSI colored pixels
+
+    Args:
+        frame2d: 24x32 array of temperatures in °C
+        out: Buffer from make_frame_buffer(), overwritten in place
+    """
+    pixels = out[:, :32 * PIXEL_BYTES].reshape(24, 32, PIXEL_BYTES)
+    np.take(ANSI, quantize(frame2d), axis=0, out=pixels)
+
+
+def capture_loop(camera, frames, stop):
+    """
+    Capture frames into a queue until stop is set
+
+    Runs in a background thread so sensor reads overlap with rendering.
+    Errors are passed through the queue to the display loop.
+
+    Args:
+        camera: Initialized MLX90640Camera
+        frames: Queue receiving frames (or the exception that stopped capture)
+        stop: Event signalling the thread to exit
+    """
+    try:
+        while not stop.is_set():
+            # get_frame() may reuse its buffer on the next call, so queue a copy
+            frames.put(camera.get_frame().copy())
+    except Exception as e:
+        frames.put(e)
 
 
 def main():
@@ -96,66 +181,57 @@ def main():
     print(f"Refresh rate: 16 Hz")
     print(f"Temperature range: {TEMP_MIN}°C - {TEMP_MAX}°C")
     print(f"Resolution: 24x32 pixels")
-    print(f"Press Ctrl+C to exit\n")
+    print(f"Press Ctrl+C to exit\n", flush=True)
 
     # Wait a moment before starting
     time.sleep(1)
 
     frame_count = 0
-    start_time = time.time()
+    fps = 0.0
+    header = b""
+    image = make_frame_buffer()
+    stdout = sys.stdout.buffer
+
+    # Capture in a background thread; the sensor paces the queue
+    frames = queue.Queue(maxsize=2)
+    stop = threading.Event()
+    capture = threading.Thread(target=capture_loop, args=(camera, frames, stop), daemon=True)
+    capture.start()
+    last_time = time.perf_counter()
 
     try:
         while True:
-            # Get frame (blocking, self-paced by sensor)
-            frame = camera.get_frame()
-
-            # Calculate FPS
+            # Get next captured frame (blocking, self-paced by sensor)
+            frame = frames.get()
+            if isinstance(frame, Exception):
+                raise frame
+
+            # Update FPS as an exponential moving average of frame intervals
+            now = time.perf_counter()
+            dt = now - last_time
+            last_time = now
+            if dt > 0:
+                rate = 1.0 / dt
+                fps = 0.9 * fps + 0.1 * rate if fps else rate
+
+            # Refresh header statistics every HEADER_EVERY frames
+            if frame_count % HEADER_EVERY == 0:
+                min_temp = frame.min()
+                max_temp = frame.max()
+                avg_temp = frame.mean()
+                header = f"FPS: {fps:5.2f} | Min: {min_temp:5.2f}°C | Max: {max_temp:5.2f}°C | Avg: {avg_temp:5.2f}°C\n".encode()
             frame_count += 1
-            elapsed = time.time() - start_time
-            fps = frame_count / elapsed if elapsed > 0 else 0
-
-            # Calculate statistics
-            min_temp = frame.min()
-            max_temp = frame.max()
-            avg_temp = frame.mean()
-
-            # Print header with stats
-            print(f"FPS: {fps:5.2f} | Min: {min_temp:5.2f}°C | Max: {max_temp:5.2f}°C | Avg: {avg_temp:5.2f}°C")
-
-            # Print thermal image with Inferno colormap
-            for y in range(24):
-                for x in range(32):
-                    # Get temperature (flip Y axis to match test.cpp orientation)
-                    temp = frame[32 * (23 - y) + x]
-
-                    # Normalize to [0, 1] for colormap
-                    normalized = (temp - TEMP_MIN) / (TEMP_MAX - TEMP_MIN)
-
-                    # Get RGB from Inferno colormap
-                    r, g, b = inferno_colormap(normalized)
-
-                    # Print with ANSI 24-bit true color
-                    # ESC[38;2;R;G;Bm sets foreground color
-                    print(f"\x1b[38;2;{r};{g};{b}m", end="")
-
-                    # Print character(s) for this pixel
-                    for _ in range(SCALE):
-                        print(BLOCK, end="")
-
-                    # Reset color
-                    print("\x1b[0m", end="")
 
-                # End of row
-                print()
+            # Flip Y axis to match test.cpp orientation
+            frame2d = frame.reshape(24, 32)[::-1]
 
-            # Move cursor up to overwrite previous frame
-            # 24 lines of image + 1 line of header = 25 lines total
-            print("\x1b[25A", end="", flush=True)
+            # Map the whole frame to precomposed colored pixels
+            render(frame2d, image)
 
-            # Reset FPS counter periodically to get recent average
-            if frame_count >= 100:
-                frame_count = 0
-                start_time = time.time()
+            # Emit header, image and cursor movement as a single write so the
+            # terminal receives each frame in one chunk without tearing
+            stdout.write(b"".join((header, image, CURSOR_UP)))
+            stdout.flush()
 
     except KeyboardInterrupt:
         # Clear the display area
@@ -169,6 +245,13 @@ def main():
         sys.exit(1)
 
     finally:
+        stop.set()
+        # Drain the queue so a capture thread blocked on put() can exit
+        while capture.is_alive():
+            try:
+                frames.get(timeout=0.1)
+            except queue.Empty:
+                pass
         camera.cleanup()
 
 
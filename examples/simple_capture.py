@@ -55,17 +55,22 @@ def main():
         correct_bad_pixels=True
     )
 
+    # Compute statistics once
+    min_temp = frame.min()
+    max_temp = frame.max()
+    avg_temp = frame.mean()
+    min_idx = int(frame.argmin())
+    max_idx = int(frame.argmax())
+
     # Display statistics
     print(f"\nFrame Statistics:")
     print(f"  Pixels: {len(frame)}")
-    print(f"  Minimum: {frame.min():.2f}°C")
-    print(f"  Maximum: {frame.max():.2f}°C")
-    print(f"  Average: {frame.mean():.2f}°C")
-    print(f"  Range: {frame.max() - frame.min():.2f}°C")
+    print(f"  Minimum: {min_temp:.2f}°C")
+    print(f"  Maximum: {max_temp:.2f}°C")
+    print(f"  Average: {avg_temp:.2f}°C")
+    print(f"  Range: {max_temp - min_temp:.2f}°C")
 
     # Find hottest pixel
-    max_temp = frame.max()
-    max_idx = frame.argmax()
     max_row = max_idx // 32
     max_col = max_idx % 32
     print(f"\nHottest pixel:")
@@ -73,8 +78,6 @@ def main():
     print(f"  Position: row {max_row}, col {max_col}")
 
     # Find coldest pixel
-    min_temp = frame.min()
-    min_idx = frame.argmin()
     min_row = min_idx // 32
     min_col = min_idx % 32
     print(f"\nColdest pixel:")
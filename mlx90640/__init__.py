@@ -34,6 +34,8 @@ class MLX90640Camera:
     is rotated 180 degrees to account for typical upside-down mounting.
     """
 
+    __slots__ = ('_camera', '_rotation', '_perm', '_out', '_frame', '_cached', '__weakref__')
+
     def __init__(self, addr=0x33, rotation=180):
         """
         Create camera instance.
@@ -44,6 +46,16 @@ class MLX90640Camera:
         """
         self._camera = _MLX90640CameraBase(addr)
         self._rotation = 0
+        self._perm = None
+
+        # Last values written to the sensor, to skip redundant I2C writes
+        self._cached = {'fps': None, 'res': None}
+
+        # Output buffer for rotated frames with reuse_buffer=True, exposed
+        # read-only; allocated on first use
+        self._out = None
+        self._frame = None
+
         self.set_rotation(rotation)
 
     def set_rotation(self, degrees):
@@ -60,6 +72,14 @@ class MLX90640Camera:
             raise ValueError(f"Rotation must be 0, 90, 180, or 270 degrees, got {degrees}")
         self._rotation = degrees
 
+        # Precompute the pixel permutation so get_frame is a single gather
+        if degrees == 0:
+            self._perm = None
+        else:
+            k = degrees // 90  # Number of 90-degree rotations
+            base = np.arange(768).reshape(24, 32)
+            self._perm = np.rot90(base, k).ravel().astype(np.int32)
+
     def get_rotation(self):
         """
         Get current image rotation.
@@ -71,6 +91,8 @@ class MLX90640Camera:
 
     def init(self):
         """Initialize camera (reads EEPROM, configures chess mode)"""
+        # init() reconfigures the sensor, so previously written values are stale
+        self._cached = {'fps': None, 'res': None}
         return self._camera.init()
 
     def cleanup(self):
@@ -79,38 +101,58 @@ class MLX90640Camera:
 
     def set_refresh_rate(self, fps):
         """Set refresh rate in Hz (1, 2, 4, 8, 16, 32, 64)"""
-        return self._camera.set_refresh_rate(fps)
+        if self._cached['fps'] == fps:
+            return 0
+        status = self._camera.set_refresh_rate(fps)
+        self._cached['fps'] = fps
+        return status
 
     def set_resolution(self, resolution):
         """Set ADC resolution (0=16bit, 1=17bit, 2=18bit, 3=19bit)"""
-        return self._camera.set_resolution(resolution)
+        if self._cached['res'] == resolution:
+            return 0
+        status = self._camera.set_resolution(resolution)
+        self._cached['res'] = resolution
+        return status
 
     def set_emissivity(self, emissivity):
         """Set emissivity (0.1-1.0, 1.0=blackbody, 0.95=skin)"""
         self._camera.set_emissivity(emissivity)
 
-    def get_frame(self, interpolate_outliers=True, correct_bad_pixels=True):
+    def get_frame(self, interpolate_outliers=True, correct_bad_pixels=True,
+                  reuse_buffer=False):
         """
         Capture frame (blocking, self-paced by sensor).
 
         Args:
             interpolate_outliers: Apply outlier interpolation (default: True)
             correct_bad_pixels: Apply bad pixel correction (default: True)
+            reuse_buffer: Write rotated frames into a buffer shared by all
+                calls instead of allocating a new array (default: False)
 
         Returns:
             NumPy array of 768 floats representing temperatures in °C.
             Layout: 24 rows x 32 columns, row-major order.
             Use .reshape((24, 32)) for 2D access.
+            With rotation 0, or with reuse_buffer=True, the array is a
+            read-only view that is overwritten by the next get_frame() call;
+            use .copy() to keep a frame. Otherwise a new array is returned.
         """
         frame = self._camera.get_frame(interpolate_outliers, correct_bad_pixels)
 
         # Apply rotation if needed
-        if self._rotation != 0:
-            # Reshape to 2D (24x32), apply rotation, flatten back to 1D
-            frame_2d = frame.reshape(24, 32)
-            k = self._rotation // 90  # Number of 90-degree rotations
-            rotated = np.rot90(frame_2d, k)
-            frame = rotated.flatten()
+        if self._perm is not None:
+            if reuse_buffer:
+                if self._out is None:
+                    self._out = np.empty(768, dtype=np.float32)
+                    self._frame = self._out.view()
+                    self._frame.flags.writeable = False
+                # Indices are always in range; mode="clip" lets take() write
+                # into out directly instead of through a temporary buffer
+                np.take(frame, self._perm, out=self._out, mode="clip")
+                frame = self._frame
+            else:
+                frame = frame.take(self._perm)
 
         return frame
 
@@ -32,6 +32,8 @@ MLX90640Camera::~MLX90640Camera() {
 
 // Initialize camera
 int MLX90640Camera::init() {
+    std::lock_guard<std::mutex> lock(mutex);
+
     // Configure device FIRST (same order as test.cpp)
     // Set continuous measurement mode
     int status = MLX90640_SetDeviceMode(i2c_addr, 0);
@@ -75,6 +77,7 @@ int MLX90640Camera::init() {
 
 // Cleanup
 void MLX90640Camera::cleanup() {
+    std::lock_guard<std::mutex> lock(mutex);
     initialized = false;
 }
 
@@ -98,6 +101,7 @@ int MLX90640Camera::set_refresh_rate(int fps) {
             );
     }
 
+    std::lock_guard<std::mutex> lock(mutex);
     int status = MLX90640_SetRefreshRate(i2c_addr, rate_code);
     if (status != 0) {
         throw std::runtime_error("Failed to set refresh rate (error " + std::to_string(status) + ")");
@@ -115,6 +119,7 @@ int MLX90640Camera::set_resolution(uint8_t res) {
         );
     }
 
+    std::lock_guard<std::mutex> lock(mutex);
     int status = MLX90640_SetResolution(i2c_addr, res);
     if (status != 0) {
         throw std::runtime_error("Failed to set resolution (error " + std::to_string(status) + ")");
@@ -131,12 +136,15 @@ void MLX90640Camera::set_emissivity(float emis) {
             ". Must be 0.1-1.0 (1.0=blackbody, 0.95=human skin)"
         );
     }
+    std::lock_guard<std::mutex> lock(mutex);
     emissivity = emis;
 }
 
 // Capture frame
 float* MLX90640Camera::get_frame(bool interpolate_outliers,
                                   bool correct_bad_pixels) {
+    std::lock_guard<std::mutex> lock(mutex);
+
     if (!initialized) {
         throw std::runtime_error("Camera not initialized. Call init() first.");
     }
@@ -169,27 +177,31 @@ float* MLX90640Camera::get_frame(bool interpolate_outliers,
         MLX90640_BadPixelsCorrection(params.outlierPixels, temp_buffer, 1, &params);
     }
 
-    // Return raw pointer (will be copied to NumPy array by pybind11 lambda)
+    // Return raw pointer (wrapped without copying by the pybind11 lambda)
     return temp_buffer;
 }
 
 // Get refresh rate
 int MLX90640Camera::get_refresh_rate() const {
+    std::lock_guard<std::mutex> lock(mutex);
     return MLX90640_GetRefreshRate(i2c_addr);
 }
 
 // Get resolution
 int MLX90640Camera::get_resolution() const {
+    std::lock_guard<std::mutex> lock(mutex);
     return MLX90640_GetCurResolution(i2c_addr);
 }
 
 // Get emissivity
 float MLX90640Camera::get_emissivity() const {
+    std::lock_guard<std::mutex> lock(mutex);
     return emissivity;
 }
 
 // Get subpage number from last captured frame
 int MLX90640Camera::get_subpage_number() const {
+    std::lock_guard<std::mutex> lock(mutex);
     if (!initialized) {
         return -1;
     }
@@ -201,6 +213,8 @@ int MLX90640Camera::get_subpage_number() const {
 PYBIND11_MODULE(_camera, m) {
     m.doc() = "MLX90640 thermal camera wrapper (chess mode only)";
 
+    // Methods that take the camera mutex release the GIL first, so waiting for
+    // a capture in progress on another thread does not block all Python threads
     py::class_<MLX90640Camera>(m, "MLX90640Camera")
         .def(py::init<uint8_t>(), py::arg("addr") = 0x33,
              "Create camera instance\n\n"
@@ -208,6 +222,7 @@ PYBIND11_MODULE(_camera, m) {
              "    addr: I2C address (default: 0x33)")
 
         .def("init", &MLX90640Camera::init,
+             py::call_guard<py::gil_scoped_release>(),
              "Initialize camera (reads EEPROM, configures chess mode)\n\n"
              "Returns:\n"
              "    0 on success\n\n"
@@ -215,9 +230,11 @@ PYBIND11_MODULE(_camera, m) {
              "    RuntimeError: If initialization fails")
 
         .def("cleanup", &MLX90640Camera::cleanup,
+             py::call_guard<py::gil_scoped_release>(),
              "Cleanup camera resources")
 
         .def("set_refresh_rate", &MLX90640Camera::set_refresh_rate,
+             py::call_guard<py::gil_scoped_release>(),
              py::arg("fps"),
              "Set refresh rate\n\n"
              "Args:\n"
@@ -230,6 +247,7 @@ PYBIND11_MODULE(_camera, m) {
              "    RuntimeError: If I2C communication fails")
 
         .def("set_resolution", &MLX90640Camera::set_resolution,
+             py::call_guard<py::gil_scoped_release>(),
              py::arg("resolution"),
              "Set ADC resolution\n\n"
              "Args:\n"
@@ -241,6 +259,7 @@ PYBIND11_MODULE(_camera, m) {
              "    RuntimeError: If I2C communication fails")
 
         .def("set_emissivity", &MLX90640Camera::set_emissivity,
+             py::call_guard<py::gil_scoped_release>(),
              py::arg("emissivity"),
              "Set emissivity\n\n"
              "Args:\n"
@@ -255,8 +274,15 @@ PYBIND11_MODULE(_camera, m) {
 
         .def("get_frame",
              [](MLX90640Camera &cam, bool interpolate_outliers, bool correct_bad_pixels) {
-                 // Call C++ get_frame which returns a raw pointer to temp_buffer
-                 float* data = cam.get_frame(interpolate_outliers, correct_bad_pixels);
+                 // Call C++ get_frame which returns a raw pointer to temp_buffer.
+                 // Release the GIL while blocked on the sensor so other Python
+                 // threads (e.g. rendering) can run in the meantime; the camera
+                 // mutex taken inside get_frame still serializes sensor access.
+                 float* data;
+                 {
+                     py::gil_scoped_release release;
+                     data = cam.get_frame(interpolate_outliers, correct_bad_pixels);
+                 }
 
                  // Create NumPy array wrapping the internal buffer with camera lifetime
                  py::array_t<float> result({768}, {sizeof(float)}, data, py::cast(cam));
@@ -273,34 +299,46 @@ PYBIND11_MODULE(_camera, m) {
              "    interpolate_outliers: Apply outlier interpolation (default: True)\n"
              "    correct_bad_pixels: Apply bad pixel correction (default: True)\n\n"
              "Returns:\n"
-             "    NumPy array of 768 floats representing temperatures in °C\n"
+             "    Read-only NumPy array of 768 floats representing temperatures in °C\n"
              "    Layout: 24 rows x 32 columns, row-major order\n"
              "    Index formula: pixel = row * 32 + col\n"
              "    Use .reshape((24, 32)) for 2D access\n\n"
+             "Note:\n"
+             "    The array is a zero-copy view of the camera's internal buffer\n"
+             "    and is overwritten by the next get_frame() call.\n"
+             "    Use .copy() to keep a frame.\n"
+             "    The GIL is released while waiting for the sensor. Calls on one\n"
+             "    camera are serialized internally, but a single camera should\n"
+             "    only capture from one thread since all frames share one buffer.\n\n"
              "Raises:\n"
              "    RuntimeError: If not initialized or frame capture fails")
 
         .def("get_refresh_rate", &MLX90640Camera::get_refresh_rate,
+             py::call_guard<py::gil_scoped_release>(),
              "Get current refresh rate register value\n\n"
              "Returns:\n"
              "    Refresh rate code (see datasheet)")
 
         .def("get_resolution", &MLX90640Camera::get_resolution,
+             py::call_guard<py::gil_scoped_release>(),
              "Get current ADC resolution\n\n"
              "Returns:\n"
              "    Resolution code (0-3)")
 
         .def("get_emissivity", &MLX90640Camera::get_emissivity,
+             py::call_guard<py::gil_scoped_release>(),
              "Get current emissivity\n\n"
              "Returns:\n"
              "    Emissivity value (0.1-1.0)")
 
         .def("is_initialized", &MLX90640Camera::is_initialized,
+             py::call_guard<py::gil_scoped_release>(),
              "Check if camera is initialized\n\n"
              "Returns:\n"
              "    True if initialized, False otherwise")
 
         .def("get_subpage_number", &MLX90640Camera::get_subpage_number,
+             py::call_guard<py::gil_scoped_release>(),
              "Get subpage number from last captured frame\n\n"
              "In chess mode, the sensor alternates between subpage 0 and 1.\n"
              "Each subpage contains half the pixels in a checkerboard pattern.\n\n"
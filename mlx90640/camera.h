@@ -9,6 +9,7 @@
 
 #include <stdint.h>
 #include <vector>
+#include <mutex>
 #include <MLX90640_API.h>
 
 class MLX90640Camera {
@@ -20,6 +21,7 @@ private:
     uint16_t eeprom[832];
     uint16_t frame_buffer[834];
     float temp_buffer[768];
+    mutable std::mutex mutex;  // Serializes sensor access and buffer updates
 
 public:
     /**
@@ -74,7 +76,8 @@ public:
      * Capture frame (blocking, self-paced by sensor) - returns raw pointer for NumPy
      * @param interpolate_outliers Apply outlier interpolation
      * @param correct_bad_pixels Apply bad pixel correction
-     * @return Pointer to 768 temperatures in °C (24x32, row-major)
+     * @return Pointer to 768 temperatures in °C (24x32, row-major), owned by the
+     *         camera and overwritten by the next get_frame() call
      * @throws runtime_error if not initialized or frame capture fails
      */
     float* get_frame(bool interpolate_outliers = true,
@@ -102,7 +105,10 @@ public:
      * Check if camera is initialized
      * @return true if initialized
      */
-    bool is_initialized() const { return initialized; }
+    bool is_initialized() const {
+        std::lock_guard<std::mutex> lock(mutex);
+        return initialized;
+    }
 
     /**
      * Get subpage number from last captured frame
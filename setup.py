@@ -28,8 +28,9 @@ ext_modules = [
         libraries=['MLX90640_API'],
         library_dirs=[current_dir],  # Local library build directory (root)
         language='c++',
-        extra_compile_args=['-std=c++11', '-fPIC', '-O3', '-march=native'],
-        extra_link_args=[f'-Wl,-rpath,{current_dir}'],
+        extra_compile_args=['-std=c++11', '-fPIC', '-O3', '-march=native',
+                            '-flto=auto', '-fno-semantic-interposition'],
+        extra_link_args=[f'-Wl,-rpath,{current_dir}', '-flto=auto'],
     ),
 ]
 